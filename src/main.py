@@ -118,7 +118,8 @@ def send_test_messages():
             "task_type": "document_processing",
             "document_id": "doc_001",
             "file_path": "test_document.txt",
-        }
+        },
+        persistent=False,
     )
 
     # 임베딩 생성 태스크
@@ -127,7 +128,8 @@ def send_test_messages():
             "task_type": "embedding_generation",
             "document_id": "doc_001",
             "text": "이것은 테스트 문서입니다.",
-        }
+        },
+        persistent=False,
     )
 
     # 파일 업로드 태스크
@@ -137,7 +139,8 @@ def send_test_messages():
             "local_path": "test_file.txt",
             "bucket_name": "documents",
             "object_name": "test_file.txt",
-        }
+        },
+        persistent=False,
     )
 
     # 알림 태스크
@@ -147,7 +150,8 @@ def send_test_messages():
             "message": "문서 처리가 완료되었습니다.",
             "recipient": "user@example.com",
             "type": "success",
-        }
+        },
+        persistent=False,
     )
 
     client.close()
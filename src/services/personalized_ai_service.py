@@ -7,23 +7,174 @@ AI 기반 개인화 분석 및 추천 서비스
 3. 포트폴리오 강점/약점 분석
 """
 
+import copy
+import hashlib
 import logging
-from typing import Dict, Any, List, Optional
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
 import openai
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from operator import itemgetter
 
 from config.settings import settings
+from utils import json_utils
 
 logger = logging.getLogger(__name__)
 
+# 프롬프트 템플릿 (str.format_map으로 값 채움)
+# 대외 활동 추천 프롬프트
+_ACTIVITY_PROMPT = """
+다음은 사용자의 포트폴리오 정보입니다:
+
+{portfolio_context}
+{preference_text}
+
+위 포트폴리오 정보를 바탕으로, 이 사용자에게 적합한 대외 활동을 추천해주세요.
+
+추천 시 다음 사항을 고려해주세요:
+1. 사용자의 기술 스택과 관련된 활동
+2. 현재 경력 수준에 맞는 활동
+3. 관심 분야와 연관된 활동
+4. 커리어 발전에 도움이 될 활동
+5. 네트워킹 기회
+
+다음 JSON 형식으로 응답해주세요:
+{{
+    "recommendations": [
+        {{
+            "activity_type": "활동 유형",
+            "title": "활동명",
+            "description": "활동 설명",
+            "recommend_reason": "추천 이유",
+            "expected_benefits": ["예상 혜택1", "예상 혜택2"],
+            "difficulty_level": "난이도 (초급/중급/고급)",
+            "time_commitment": "예상 소요 시간"
+        }}
+    ],
+    "overall_strategy": "전체적인 대외 활동 전략 조언",
+    "priority_areas": ["우선순위 영역1", "우선순위 영역2"]
+}}
+"""
+
+# 채용 공고 추천 프롬프트
+_JOB_PROMPT = """
+다음은 구직자의 포트폴리오 정보입니다:
+
+{portfolio_context}
+{preference_text}
+
+위 포트폴리오 정보를 바탕으로, 이 구직자에게 적합한 채용 공고 유형과 지원 전략을 추천해주세요.
+
+추천 시 다음 사항을 분석해주세요:
+1. 현재 기술 스택으로 지원 가능한 포지션
+2. 경력 수준에 맞는 회사 및 역할
+3. 강점을 살릴 수 있는 업무 분야
+4. 부족한 부분을 보완할 수 있는 기회
+5. 커리어 성장 관점에서의 전략적 선택
+
+다음 JSON 형식으로 응답해주세요:
+{{
+    "job_recommendations": [
+        {{
+            "position": "추천 포지션",
+            "company_type": "적합한 회사 유형",
+            "job_description": "업무 내용",
+            "match_reason": "적합성 이유",
+            "required_skills": ["필요 기술1", "필요 기술2"],
+            "advantage_points": ["지원 시 강점1", "지원 시 강점2"],
+            "preparation_needed": ["준비 필요 사항1", "준비 필요 사항2"],
+            "salary_range": "예상 연봉 범위",
+            "career_growth": "커리어 성장 가능성"
+        }}
+    ],
+    "application_strategy": "지원 전략 조언",
+    "skill_gap_analysis": "기술 격차 분석",
+    "market_insights": "채용 시장 인사이트"
+}}
+"""
+
+# 포트폴리오 강점/약점 분석 프롬프트
+_ANALYZE_PROMPT = """
+다음은 분석할 포트폴리오 정보입니다:
+
+{portfolio_context}
+{focus_text}
+
+위 포트폴리오를 종합적으로 분석하여 강점과 약점을 평가해주세요.
+
+분석 관점:
+1. 기술적 역량 (Technical Skills)
+2. 프로젝트 경험 (Project Experience) 
+3. 업무 경험 (Work Experience)
+4. 교육 배경 (Educational Background)
+5. 성장 잠재력 (Growth Potential)
+6. 차별화 요소 (Differentiation)
+
+다음 JSON 형식으로 응답해주세요:
+{{
+    "strength": "포트폴리오의 주요 강점을 종합적으로 설명하는 문장",
+    "weakness": "포트폴리오의 주요 약점을 종합적으로 설명하는 문장",
+    "recommend_position": "이 포트폴리오에 가장 적합한 추천 포지션"
+}}
+
+각 필드는 다음과 같이 작성해주세요:
+- strength: 여러 강점들을 한 문장으로 통합해서 설명 (약 50-100자)
+- weakness: 여러 약점들을 한 문장으로 통합해서 설명 (약 50-100자) 
+- recommend_position: 강점과 약점을 종합하여 가장 적합한 직무/포지션 추천 (간단명료하게)
+"""
+
+# 작업 큐 데이터 기반 포트폴리오 분석 프롬프트
+_ANALYZE_FROM_DATA_PROMPT = """
+다음은 분석할 포트폴리오 정보입니다:
+
+{portfolio_text}
+
+위 포트폴리오를 종합적으로 분석하여 요약, 강점, 약점, 추천 직무를 제공해주세요.
+
+분석 관점:
+1. 기술적 역량 (Technical Skills)
+2. 프로젝트/활동 경험 (Project/Activity Experience) 
+3. 교육 배경 (Educational Background)
+4. 성장 잠재력 (Growth Potential)
+5. 차별화 요소 (Differentiation)
+
+다음 JSON 형식으로 응답해주세요:
+{{
+    "summary": "포트폴리오 전체를 요약하는 문장 (현재 상황과 역량을 객관적으로 나열)",
+    "strength": "포트폴리오의 주요 강점을 종합적으로 설명하는 문장",
+    "weakness": "포트폴리오의 주요 약점을 종합적으로 설명하는 문장",
+    "recommendPosition": "이 포트폴리오에 가장 적합한 추천 직무"
+}}
+
+각 필드는 다음과 같이 작성해주세요:
+- summary: 전체적인 상황과 역량을 객관적으로 나열 (약 150-300자)
+- strength: 여러 강점들을 열거형으로 나열하여 상세히 설명 (약 300-500자)
+- weakness: 여러 약점들을 열거형으로 나열하여 설명 (약 50-100자) 
+- recommendPosition: 강점과 약점을 종합하여 가장 적합한 직무/포지션 추천 (간단명료하게)
+"""
+
 
 class PersonalizedAIService:
     """개인화 AI 분석 및 추천 서비스"""
 
-    def __init__(self, test_mode: bool = False):
-        """서비스 초기화"""
+    def __init__(self, test_mode: bool = False, response_cache_size: int = 128):
+        """
+        서비스 초기화
+
+        Args:
+            test_mode: True일 경우 OpenAI API 호출 없이 모의 응답 반환
+            response_cache_size: 동일 프롬프트 응답을 재사용할 캐시 크기 (0이면 비활성화)
+        """
         self.test_mode = test_mode
+        self.model = settings.openai_model
+
+        # 동일한 요청에 대한 OpenAI 응답 캐시 (LRU)
+        self.response_cache_size = response_cache_size
+        self._response_cache: "OrderedDict[str, Tuple[str, Any]]" = OrderedDict()
+        self._response_cache_lock = threading.Lock()
 
         if not test_mode:
             # OpenAI 클라이언트 설정
@@ -40,96 +191,70 @@ class PersonalizedAIService:
             포트폴리오 정보를 종합한 컨텍스트 문자열
         """
         try:
-            # 포트폴리오 데이터베이스에서 모든 문서 가져오기
-            count = self.portfolio_db.get_collection_count()
-            if count == 0:
-                return "포트폴리오 정보가 없습니다."
-
-            # 전체 포트폴리오 내용 조회
+            # 전체 포트폴리오 내용 조회 (별도의 개수 조회 없이 한 번에 가져옴)
             results = self.portfolio_db.collection.get(
                 include=["documents", "metadatas"]
             )
 
-            if not results or not results.get("documents"):
+            if not results:
                 return "포트폴리오 정보를 가져올 수 없습니다."
+            if not results.get("documents"):
+                return "포트폴리오 정보가 없습니다."
 
             # 청크별로 정리된 포트폴리오 내용을 하나의 컨텍스트로 결합
             documents = results["documents"]
-            metadatas = results.get("metadatas", [])
+            metadatas = results.get("metadatas") or [None] * len(documents)
 
             # 청크 인덱스 순으로 정렬
-            sorted_docs = []
-            for i, (doc, meta) in enumerate(zip(documents, metadatas)):
-                chunk_index = meta.get("chunk_index", i) if meta else i
-                sorted_docs.append((chunk_index, doc))
-
-            sorted_docs.sort(key=lambda x: x[0])
+            sorted_docs = sorted(
+                (
+                    (meta.get("chunk_index", i) if meta else i, doc)
+                    for i, (doc, meta) in enumerate(zip(documents, metadatas))
+                ),
+                key=itemgetter(0),
+            )
 
             # 포트폴리오 전체 내용 결합
-            full_portfolio = "\n\n".join([doc for _, doc in sorted_docs])
-
-            return full_portfolio
+            return "\n\n".join(doc for _, doc in sorted_docs)
 
         except Exception as e:
             logger.error(f"포트폴리오 컨텍스트 생성 실패: {str(e)}")
             return "포트폴리오 정보를 가져오는 중 오류가 발생했습니다."
 
     def recommend_activities(
-        self, preferences: Optional[Dict[str, Any]] = None
+        self,
+        preferences: Optional[Dict[str, Any]] = None,
+        portfolio_context: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         포트폴리오 기반 대외 활동 추천
 
         Args:
             preferences: 사용자 선호도 (선택사항)
+            portfolio_context: 미리 조회한 포트폴리오 컨텍스트 (없으면 새로 조회)
 
         Returns:
             AI가 분석한 맞춤형 대외 활동 추천
         """
         try:
             # 포트폴리오 컨텍스트 가져오기
-            portfolio_context = self.get_user_profile_context()
+            if portfolio_context is None:
+                portfolio_context = self.get_user_profile_context()
 
             # 선호도 정보 처리
             preference_text = ""
             if preferences:
-                preference_text = f"\n\n사용자 선호사항:\n"
-                for key, value in preferences.items():
-                    preference_text += f"- {key}: {value}\n"
+                preference_text = "\n\n사용자 선호사항:\n" + "".join(
+                    f"- {key}: {value}\n" for key, value in preferences.items()
+                )
 
             # AI 프롬프트 구성
-            prompt = f"""
-다음은 사용자의 포트폴리오 정보입니다:
-
-{portfolio_context}
-{preference_text}
-
-위 포트폴리오 정보를 바탕으로, 이 사용자에게 적합한 대외 활동을 추천해주세요.
-
-추천 시 다음 사항을 고려해주세요:
-1. 사용자의 기술 스택과 관련된 활동
-2. 현재 경력 수준에 맞는 활동
-3. 관심 분야와 연관된 활동
-4. 커리어 발전에 도움이 될 활동
-5. 네트워킹 기회
-
-다음 JSON 형식으로 응답해주세요:
-{{
-    "recommendations": [
-        {{
-            "activity_type": "활동 유형",
-            "title": "활동명",
-            "description": "활동 설명",
-            "recommend_reason": "추천 이유",
-            "expected_benefits": ["예상 혜택1", "예상 혜택2"],
-            "difficulty_level": "난이도 (초급/중급/고급)",
-            "time_commitment": "예상 소요 시간"
-        }}
-    ],
-    "overall_strategy": "전체적인 대외 활동 전략 조언",
-    "priority_areas": ["우선순위 영역1", "우선순위 영역2"]
-}}
-"""
+            prompt = _ACTIVITY_PROMPT.format_map(
+                {
+                    "portfolio_context": portfolio_context,
+                    "preference_text": preference_text,
+                }
+            )
 
             if self.test_mode:
                 # 테스트 모드에서는 고정된 응답 반환
@@ -151,97 +276,63 @@ class PersonalizedAIService:
                 }
 
             # OpenAI API 호출
-            response = self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "당신은 커리어 전문 컨설턴트입니다. 주어진 포트폴리오를 분석하여 맞춤형 대외 활동을 추천해주세요.",
-                    },
-                    {"role": "user", "content": prompt},
-                ],
+            ai_response, result = self._request_completion(
+                system_prompt="당신은 커리어 전문 컨설턴트입니다. 주어진 포트폴리오를 분석하여 맞춤형 대외 활동을 추천해주세요.",
+                prompt=prompt,
                 temperature=0.7,
                 max_tokens=2000,
             )
 
-            # 응답 파싱
-            ai_response = response.choices[0].message.content
-
-            try:
-                result = json.loads(ai_response)
-                result["success"] = True
-                result["generated_at"] = datetime.now().isoformat()
-                return result
-            except json.JSONDecodeError:
+            # 응답 파싱 결과 확인
+            if result is None:
                 return {
                     "success": False,
                     "error": "AI 응답 파싱 실패",
                     "raw_response": ai_response,
                 }
 
+            result["success"] = True
+            result["generated_at"] = datetime.now().isoformat()
+            return result
+
         except Exception as e:
             logger.error(f"대외 활동 추천 실패: {str(e)}")
             return {"success": False, "error": str(e)}
 
     def recommend_jobs(
-        self, job_preferences: Optional[Dict[str, Any]] = None
+        self,
+        job_preferences: Optional[Dict[str, Any]] = None,
+        portfolio_context: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         포트폴리오 기반 채용 공고 추천
 
         Args:
             job_preferences: 채용 선호도 (지역, 연봉, 회사 규모 등)
+            portfolio_context: 미리 조회한 포트폴리오 컨텍스트 (없으면 새로 조회)
 
         Returns:
             AI가 분석한 맞춤형 채용 공고 추천
         """
         try:
             # 포트폴리오 컨텍스트 가져오기
-            portfolio_context = self.get_user_profile_context()
+            if portfolio_context is None:
+                portfolio_context = self.get_user_profile_context()
 
             # 채용 선호도 정보 처리
             preference_text = ""
             if job_preferences:
-                preference_text = f"\n\n채용 선호사항:\n"
-                for key, value in job_preferences.items():
-                    preference_text += f"- {key}: {value}\n"
+                preference_text = "\n\n채용 선호사항:\n" + "".join(
+                    f"- {key}: {value}\n" for key, value in job_preferences.items()
+                )
 
             # AI 프롬프트 구성
-            prompt = f"""
-다음은 구직자의 포트폴리오 정보입니다:
-
-{portfolio_context}
-{preference_text}
-
-위 포트폴리오 정보를 바탕으로, 이 구직자에게 적합한 채용 공고 유형과 지원 전략을 추천해주세요.
-
-추천 시 다음 사항을 분석해주세요:
-1. 현재 기술 스택으로 지원 가능한 포지션
-2. 경력 수준에 맞는 회사 및 역할
-3. 강점을 살릴 수 있는 업무 분야
-4. 부족한 부분을 보완할 수 있는 기회
-5. 커리어 성장 관점에서의 전략적 선택
-
-다음 JSON 형식으로 응답해주세요:
-{{
-    "job_recommendations": [
-        {{
-            "position": "추천 포지션",
-            "company_type": "적합한 회사 유형",
-            "job_description": "업무 내용",
-            "match_reason": "적합성 이유",
-            "required_skills": ["필요 기술1", "필요 기술2"],
-            "advantage_points": ["지원 시 강점1", "지원 시 강점2"],
-            "preparation_needed": ["준비 필요 사항1", "준비 필요 사항2"],
-            "salary_range": "예상 연봉 범위",
-            "career_growth": "커리어 성장 가능성"
-        }}
-    ],
-    "application_strategy": "지원 전략 조언",
-    "skill_gap_analysis": "기술 격차 분석",
-    "market_insights": "채용 시장 인사이트"
-}}
-"""
+            prompt = _JOB_PROMPT.format_map(
+                {
+                    "portfolio_context": portfolio_context,
+                    "preference_text": preference_text,
+                }
+            )
 
             if self.test_mode:
                 # 테스트 모드에서는 고정된 응답 반환
@@ -272,86 +363,61 @@ class PersonalizedAIService:
                 }
 
             # OpenAI API 호출
-            response = self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "당신은 전문 채용 컨설턴트입니다. 포트폴리오를 분석하여 맞춤형 채용 정보를 제공해주세요.",
-                    },
-                    {"role": "user", "content": prompt},
-                ],
+            ai_response, result = self._request_completion(
+                system_prompt="당신은 전문 채용 컨설턴트입니다. 포트폴리오를 분석하여 맞춤형 채용 정보를 제공해주세요.",
+                prompt=prompt,
                 temperature=0.7,
                 max_tokens=2500,
             )
 
-            # 응답 파싱
-            ai_response = response.choices[0].message.content
-
-            try:
-                result = json.loads(ai_response)
-                result["success"] = True
-                result["generated_at"] = datetime.now().isoformat()
-                return result
-            except json.JSONDecodeError:
+            # 응답 파싱 결과 확인
+            if result is None:
                 return {
                     "success": False,
                     "error": "AI 응답 파싱 실패",
                     "raw_response": ai_response,
                 }
 
+            result["success"] = True
+            result["generated_at"] = datetime.now().isoformat()
+            return result
+
         except Exception as e:
             logger.error(f"채용 공고 추천 실패: {str(e)}")
             return {"success": False, "error": str(e)}
 
     def analyze_portfolio_strengths_weaknesses(
-        self, analysis_focus: Optional[List[str]] = None
+        self,
+        analysis_focus: Optional[List[str]] = None,
+        portfolio_context: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         포트폴리오 강점/약점 분석
 
         Args:
             analysis_focus: 분석 초점 영역 (예: ["기술", "경험", "프로젝트"])
+            portfolio_context: 미리 조회한 포트폴리오 컨텍스트 (없으면 새로 조회)
 
         Returns:
             AI가 분석한 포트폴리오 강점/약점 및 개선 방안
         """
         try:
             # 포트폴리오 컨텍스트 가져오기
-            portfolio_context = self.get_user_profile_context()
+            if portfolio_context is None:
+                portfolio_context = self.get_user_profile_context()
 
             # 분석 초점 설정
             focus_text = ""
             if analysis_focus:
-                focus_text = f"\n\n특별히 다음 영역에 중점을 두어 분석해주세요: {', '.join(analysis_focus)}"  # AI 프롬프트 구성
-            prompt = f"""
-다음은 분석할 포트폴리오 정보입니다:
-
-{portfolio_context}
-{focus_text}
+                focus_text = f"\n\n특별히 다음 영역에 중점을 두어 분석해주세요: {', '.join(analysis_focus)}"
 
-위 포트폴리오를 종합적으로 분석하여 강점과 약점을 평가해주세요.
-
-분석 관점:
-1. 기술적 역량 (Technical Skills)
-2. 프로젝트 경험 (Project Experience) 
-3. 업무 경험 (Work Experience)
-4. 교육 배경 (Educational Background)
-5. 성장 잠재력 (Growth Potential)
-6. 차별화 요소 (Differentiation)
-
-다음 JSON 형식으로 응답해주세요:
-{{
-    "strength": "포트폴리오의 주요 강점을 종합적으로 설명하는 문장",
-    "weakness": "포트폴리오의 주요 약점을 종합적으로 설명하는 문장",
-    "recommend_position": "이 포트폴리오에 가장 적합한 추천 포지션"
-}}
-
-각 필드는 다음과 같이 작성해주세요:
-- strength: 여러 강점들을 한 문장으로 통합해서 설명 (약 50-100자)
-- weakness: 여러 약점들을 한 문장으로 통합해서 설명 (약 50-100자) 
-- recommend_position: 강점과 약점을 종합하여 가장 적합한 직무/포지션 추천 (간단명료하게)
-"""
+            # AI 프롬프트 구성
+            prompt = _ANALYZE_PROMPT.format_map(
+                {
+                    "portfolio_context": portfolio_context,
+                    "focus_text": focus_text,
+                }
+            )
 
             if self.test_mode:
                 # 테스트 모드에서는 고정된 응답 반환
@@ -362,34 +428,25 @@ class PersonalizedAIService:
                     "recommend_position": "프론트엔드 개발자",
                     "generated_at": datetime.now().isoformat(),
                 }  # OpenAI API 호출
-            response = self.client.chat.completions.create(
-                model=settings.openai_model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "당신은 전문 포트폴리오 분석가입니다. 객관적이고 건설적인 피드백을 제공해주세요.",
-                    },
-                    {"role": "user", "content": prompt},
-                ],
+            ai_response, result = self._request_completion(
+                system_prompt="당신은 전문 포트폴리오 분석가입니다. 객관적이고 건설적인 피드백을 제공해주세요.",
+                prompt=prompt,
                 temperature=0.5,
-                max_tokens=3000,
+                max_tokens=1000,
             )
 
-            # 응답 파싱
-            ai_response = response.choices[0].message.content
-
-            try:
-                result = json.loads(ai_response)
-                result["success"] = True
-                result["generated_at"] = datetime.now().isoformat()
-                return result
-            except json.JSONDecodeError:
+            # 응답 파싱 결과 확인
+            if result is None:
                 return {
                     "success": False,
                     "error": "AI 응답 파싱 실패",
                     "raw_response": ai_response,
                 }
 
+            result["success"] = True
+            result["generated_at"] = datetime.now().isoformat()
+            return result
+
         except Exception as e:
             logger.error(f"포트폴리오 분석 실패: {str(e)}")
             return {"success": False, "error": str(e)}
@@ -407,10 +464,29 @@ class PersonalizedAIService:
             대외활동 추천, 채용 추천, 포트폴리오 분석을 통합한 종합 인사이트
         """
         try:
-            # 3가지 분석 실행
-            activities = self.recommend_activities(preferences)
-            jobs = self.recommend_jobs(preferences)
-            analysis = self.analyze_portfolio_strengths_weaknesses()
+            # 포트폴리오 컨텍스트는 한 번만 조회하여 3가지 분석에서 공유
+            portfolio_context = self.get_user_profile_context()
+
+            # 3가지 분석을 동시에 실행 (각 분석은 독립적인 OpenAI API 호출)
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                activities_future = executor.submit(
+                    self.recommend_activities,
+                    preferences,
+                    portfolio_context=portfolio_context,
+                )
+                jobs_future = executor.submit(
+                    self.recommend_jobs,
+                    preferences,
+                    portfolio_context=portfolio_context,
+                )
+                analysis_future = executor.submit(
+                    self.analyze_portfolio_strengths_weaknesses,
+                    portfolio_context=portfolio_context,
+                )
+
+                activities = activities_future.result()
+                jobs = jobs_future.result()
+                analysis = analysis_future.result()
 
             return {
                 "success": True,
@@ -449,77 +525,58 @@ class PersonalizedAIService:
             user_id = analysis_data.get("userId")
             analysis_id = analysis_data.get("analysisId")
 
+            # 분석할 데이터가 없으면 AI 호출 없이 바로 반환
+            if not activities and not educations:
+                return {
+                    "analysisId": analysis_id,
+                    "taskType": "ANALYZE",
+                    "userId": user_id,
+                    "success": False,
+                    "result": None,
+                    "errorMessage": "분석할 포트폴리오 정보가 없습니다.",
+                    "completedAt": datetime.now().isoformat(),
+                }
+
             # 포트폴리오 텍스트 구성
             portfolio_text = self._build_portfolio_from_data(activities, educations)
 
             # AI 프롬프트 구성
-            prompt = f"""
-다음은 분석할 포트폴리오 정보입니다:
-
-{portfolio_text}
-
-위 포트폴리오를 종합적으로 분석하여 요약, 강점, 약점, 추천 직무를 제공해주세요.
-
-분석 관점:
-1. 기술적 역량 (Technical Skills)
-2. 프로젝트/활동 경험 (Project/Activity Experience) 
-3. 교육 배경 (Educational Background)
-4. 성장 잠재력 (Growth Potential)
-5. 차별화 요소 (Differentiation)
-
-다음 JSON 형식으로 응답해주세요:
-{{
-    "summary": "포트폴리오 전체를 요약하는 문장 (현재 상황과 역량을 객관적으로 나열)",
-    "strength": "포트폴리오의 주요 강점을 종합적으로 설명하는 문장",
-    "weakness": "포트폴리오의 주요 약점을 종합적으로 설명하는 문장",
-    "recommendPosition": "이 포트폴리오에 가장 적합한 추천 직무"
-}}
-
-각 필드는 다음과 같이 작성해주세요:
-- summary: 전체적인 상황과 역량을 객관적으로 나열 (약 150-300자)
-- strength: 여러 강점들을 열거형으로 나열하여 상세히 설명 (약 300-500자)
-- weakness: 여러 약점들을 열거형으로 나열하여 설명 (약 50-100자) 
-- recommendPosition: 강점과 약점을 종합하여 가장 적합한 직무/포지션 추천 (간단명료하게)
-"""
+            prompt = _ANALYZE_FROM_DATA_PROMPT.format_map(
+                {
+                    "portfolio_text": portfolio_text,
+                }
+            )
 
             # OpenAI API 호출
-            response = self.client.chat.completions.create(
-                model=settings.openai_model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "당신은 전문 포트폴리오 분석가입니다. 객관적이고 건설적인 피드백을 제공해주세요.",
-                    },
-                    {"role": "user", "content": prompt},
-                ],
+            ai_response, result = self._request_completion(
+                system_prompt="당신은 전문 포트폴리오 분석가입니다. 객관적이고 건설적인 피드백을 제공해주세요.",
+                prompt=prompt,
                 temperature=0.5,
                 max_tokens=1500,
             )
 
-            # 응답 파싱
-            ai_response = response.choices[0].message.content
-
-            try:
-                return {
-                    "analysisId": analysis_id,
-                    "taskType": "ANALYZE",
-                    "userId": user_id,
-                    "success": True,
-                    "result": json.loads(ai_response),
-                    "errorMessage": None,
-                    "completedAt": datetime.now().isoformat(),
-                }
-            except json.JSONDecodeError:
+            # 응답 파싱 결과 확인
+            if result is None:
                 return {
                     "analysisId": analysis_id,
                     "taskType": "ANALYZE",
                     "userId": user_id,
                     "success": False,
-                    "result": json.loads(ai_response),
+                    "result": None,
                     "errorMessage": "AI 응답 파싱 실패",
                     "completedAt": datetime.now().isoformat(),
                 }
 
+            return {
+                "analysisId": analysis_id,
+                "taskType": "ANALYZE",
+                "userId": user_id,
+                "success": True,
+                "result": result,
+                "errorMessage": None,
+                "completedAt": datetime.now().isoformat(),
+            }
+
         except Exception as e:
             logger.error(f"포트폴리오 분석 실패: {str(e)}")
             return {
@@ -532,6 +589,66 @@ class PersonalizedAIService:
                 "completedAt": datetime.now().isoformat(),
             }
 
+    def _request_completion(
+        self, system_prompt: str, prompt: str, temperature: float, max_tokens: int
+    ) -> Tuple[str, Optional[Any]]:
+        """
+        OpenAI 채팅 API를 호출하여 응답 본문과 파싱 결과를 반환
+
+        응답은 여기서 한 번만 파싱하며, 파싱에 실패하면 파싱 결과로 None을 반환합니다.
+        같은 모델/프롬프트/파라미터로 이미 받은 유효한 JSON 응답이 캐시에 있으면
+        API를 호출하지 않고 재사용합니다. 호출자가 중첩된 목록까지 수정해도 캐시가
+        오염되지 않도록 항상 깊은 복사본을 반환합니다.
+        """
+        cache_key = None
+        if self.response_cache_size > 0:
+            cache_key = hashlib.sha256(
+                "\0".join(
+                    (
+                        self.model,
+                        system_prompt,
+                        prompt,
+                        str(temperature),
+                        str(max_tokens),
+                    )
+                ).encode("utf-8")
+            ).hexdigest()
+
+            with self._response_cache_lock:
+                cached = self._response_cache.get(cache_key)
+                if cached is not None:
+                    self._response_cache.move_to_end(cache_key)
+                    logger.info("캐시된 AI 응답 사용")
+                    ai_response, result = cached
+                    return ai_response, copy.deepcopy(result)
+
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt},
+            ],
+            temperature=temperature,
+            max_tokens=max_tokens,
+            response_format={"type": "json_object"},
+        )
+        ai_response = response.choices[0].message.content
+
+        try:
+            result = json_utils.loads(ai_response)
+        except json.JSONDecodeError:
+            return ai_response, None
+
+        # 파싱에 성공한 응답만 캐시 (실패한 응답이 재사용되지 않도록)
+        if cache_key is not None:
+            with self._response_cache_lock:
+                self._response_cache[cache_key] = (ai_response, result)
+                self._response_cache.move_to_end(cache_key)
+                while len(self._response_cache) > self.response_cache_size:
+                    self._response_cache.popitem(last=False)
+
+        return ai_response, copy.deepcopy(result)
+
     def _build_portfolio_from_data(
         self, activities: List[Dict], educations: List[Dict]
     ) -> str:
@@ -550,30 +667,33 @@ class PersonalizedAIService:
         # 교육 배경 섹션
         if educations:
             portfolio_sections.append("=== 교육 배경 ===")
-            for edu in educations:
-                school = edu.get("school", "학교명 없음")
-                major = edu.get("major", "전공 없음")
-                grade = edu.get("grade", "성적 없음")
-                portfolio_sections.append(f"- {school} {major} (학점: {grade})")
+            portfolio_sections.extend(
+                f"- {edu.get('school', '학교명 없음')} {edu.get('major', '전공 없음')} "
+                f"(학점: {edu.get('grade', '성적 없음')})"
+                for edu in educations
+            )
 
         # 활동/경험 섹션
         if activities:
             portfolio_sections.append("\n=== 활동 및 경험 ===")
-            for activity in activities:
-                title = activity.get("title", "제목 없음")
-                description = activity.get("description", "설명 없음")
-                content = activity.get("content", "")
-                tags = activity.get("tags", [])
-
-                portfolio_sections.append(f"◆ {title}")
-                portfolio_sections.append(f"  설명: {description}")
-                if content:
-                    portfolio_sections.append(f"  상세: {content}")
-                if tags:
-                    portfolio_sections.append(f"  태그: {', '.join(tags)}")
+            portfolio_sections.extend(
+                self._format_activity(activity) for activity in activities
+            )
 
         return (
             "\n".join(portfolio_sections)
             if portfolio_sections
             else "포트폴리오 정보가 없습니다."
         )
+
+    @staticmethod
+    def _format_activity(activity: Dict) -> str:
+        """활동 정보 하나를 포트폴리오 텍스트 블록으로 변환"""
+        content = activity.get("content", "")
+        tags = activity.get("tags", [])
+        return (
+            f"◆ {activity.get('title', '제목 없음')}\n"
+            f"  설명: {activity.get('description', '설명 없음')}"
+            + (f"\n  상세: {content}" if content else "")
+            + (f"\n  태그: {', '.join(tags)}" if tags else "")
+        )
@@ -9,9 +9,9 @@ import pika
 import logging
 import asyncio
 import json
-from typing import Callable, Dict, Any, Optional
-from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Any, Optional, Union
 from config.settings import settings
+from utils import json_utils
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
@@ -25,6 +25,8 @@ class RabbitMQClient:
         host: str = "localhost",
         work_queue: str = "ai.work.queue",
         result_queue: str = "ai.result.queue",
+        prefetch_count: int = 32,
+        poll_interval: float = 0.01,
     ):
         """
         RabbitMQ 클라이언트 초기화
@@ -33,13 +35,16 @@ class RabbitMQClient:
             host: RabbitMQ 서버 호스트
             work_queue: 작업 요청을 받을 큐 이름
             result_queue: 결과를 보낼 큐 이름
+            prefetch_count: 동시에 처리할 수 있는 미확인(unacked) 메시지 최대 개수
+            poll_interval: 비동기 소비 시 이벤트 확인 간격 (초)
         """
         self.host = host
         self.work_queue = work_queue
         self.result_queue = result_queue
+        self.prefetch_count = prefetch_count
+        self.poll_interval = poll_interval
         self.connection = None
         self.channel = None
-        self.executor = ThreadPoolExecutor(max_workers=10)
         self._connect()
 
     def _connect(self):
@@ -60,6 +65,9 @@ class RabbitMQClient:
             self.channel.queue_declare(queue=self.work_queue, durable=True)
             self.channel.queue_declare(queue=self.result_queue, durable=True)
 
+            # 처리 중인 메시지 수를 prefetch_count로 제한
+            self.channel.basic_qos(prefetch_count=self.prefetch_count)
+
             logger.info(
                 f"RabbitMQ에 연결되었습니다. 작업 큐: {self.work_queue}, 결과 큐: {self.result_queue}"
             )
@@ -67,8 +75,20 @@ class RabbitMQClient:
             logger.error(f"RabbitMQ 연결 실패: {str(e)}")
             raise
 
-    def publish(self, message: str, queue_name: Optional[str] = None):
-        """메시지를 큐에 게시"""
+    def publish(
+        self,
+        message: Union[str, bytes],
+        queue_name: Optional[str] = None,
+        persistent: bool = True,
+    ):
+        """
+        메시지를 큐에 게시
+
+        Args:
+            message: 게시할 메시지
+            queue_name: 대상 큐 이름 (기본값: 결과 큐)
+            persistent: False이면 브로커가 디스크에 기록하지 않는 일시적 메시지로 게시
+        """
         try:
             target_queue = queue_name or self.result_queue
             self.channel.basic_publish(
@@ -76,18 +96,25 @@ class RabbitMQClient:
                 routing_key=target_queue,
                 body=message,
                 properties=pika.BasicProperties(
-                    delivery_mode=2,  # 메시지 지속성 설정
+                    delivery_mode=2 if persistent else 1,  # 메시지 지속성 설정
                 ),
             )
-            logger.info(f"메시지가 큐에 게시되었습니다: {message} -> {target_queue}")
+            logger.info(
+                "메시지가 큐에 게시되었습니다: %s (길이: %d)", target_queue, len(message)
+            )
         except Exception as e:
             logger.error(f"메시지 게시 실패: {str(e)}")
 
-    def publish_json(self, data: Dict[str, Any], queue_name: Optional[str] = None):
+    def publish_json(
+        self,
+        data: Dict[str, Any],
+        queue_name: Optional[str] = None,
+        persistent: bool = True,
+    ):
         """JSON 데이터를 큐에 게시"""
         try:
-            message = json.dumps(data, ensure_ascii=False)
-            self.publish(message, queue_name)
+            message = json_utils.dumps(data)
+            self.publish(message, queue_name, persistent=persistent)
         except Exception as e:
             logger.error(f"JSON 메시지 게시 실패: {str(e)}")
 
@@ -100,37 +127,58 @@ class RabbitMQClient:
         self.publish_json(work_data, self.work_queue)
 
     async def async_consume_work_queue(self, async_callback: Callable):
-        """작업 큐에서 비동기로 메시지를 소비"""
+        """
+        작업 큐에서 비동기로 메시지를 소비
+
+        메시지는 콜백 처리가 끝난 뒤에 확인(ack)되므로, 동시에 처리되는
+        메시지 수는 prefetch_count를 넘지 않습니다.
+        """
+        # 실행 중인 태스크가 GC되지 않도록 참조 유지
+        pending_tasks = set()
+
+        async def handle_message(ch, delivery_tag, data):
+            try:
+                await async_callback(data)
+                ch.basic_ack(delivery_tag=delivery_tag)
+            except Exception as e:
+                logger.error(f"작업 큐 메시지 처리 중 오류 발생: {str(e)}")
+                ch.basic_nack(delivery_tag=delivery_tag, requeue=False)
 
         def callback_wrapper(ch, method, properties, body):
             try:
                 # 메시지를 JSON으로 파싱 시도
                 try:
-                    data = json.loads(body.decode("utf-8"))
+                    data = json_utils.loads(body)
                 except json.JSONDecodeError:
                     data = body.decode("utf-8")
 
                 # 비동기 태스크 생성
-                asyncio.create_task(async_callback(data))
-                logger.info(f"작업 큐에서 비동기 태스크가 생성되었습니다: {data}")
+                task = asyncio.create_task(
+                    handle_message(ch, method.delivery_tag, data)
+                )
+                pending_tasks.add(task)
+                task.add_done_callback(pending_tasks.discard)
+                logger.info("작업 큐에서 비동기 태스크가 생성되었습니다: %s", data)
 
             except Exception as e:
                 logger.error(f"작업 큐 메시지 처리 중 오류 발생: {str(e)}")
+                ch.basic_nack(delivery_tag=method.delivery_tag, requeue=False)
 
         try:
             self.channel.basic_consume(
                 queue=self.work_queue,
                 on_message_callback=callback_wrapper,
-                auto_ack=True,
+                auto_ack=False,
             )
             logger.info(
                 f"작업 큐({self.work_queue})에서 비동기 메시지 소비를 시작합니다."
             )
 
             # 논블로킹 방식으로 메시지 처리
+            # (time_limit=0: 대기 중인 이벤트만 처리하고 즉시 반환하여 이벤트 루프를 막지 않음)
             while True:
-                self.connection.process_data_events(time_limit=1)
-                await asyncio.sleep(0.1)  # 다른 코루틴에게 제어권 양보
+                self.connection.process_data_events(time_limit=0)
+                await asyncio.sleep(self.poll_interval)  # 다른 코루틴에게 제어권 양보
 
         except Exception as e:
             logger.error(f"작업 큐 비동기 메시지 소비 실패: {str(e)}")
@@ -159,5 +207,3 @@ class RabbitMQClient:
         if self.connection:
             self.connection.close()
             logger.info("RabbitMQ 연결이 종료되었습니다.")
-        if self.executor:
-            self.executor.shutdown(wait=True)
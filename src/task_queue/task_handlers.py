@@ -4,14 +4,26 @@
 다양한 종류의 비동기 태스크를 처리하는 핸들러 함수들
 """
 
+import asyncio
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from datetime import datetime
 
 from services.personalized_ai_service import PersonalizedAIService
 
 logger = logging.getLogger(__name__)
 
+# 메시지마다 OpenAI 클라이언트를 새로 만들지 않도록 서비스 인스턴스를 재사용
+_ai_service: Optional[PersonalizedAIService] = None
+
+
+def _get_ai_service() -> PersonalizedAIService:
+    """공유 PersonalizedAIService 인스턴스 반환 (최초 호출 시 생성)"""
+    global _ai_service
+    if _ai_service is None:
+        _ai_service = PersonalizedAIService(test_mode=False)
+    return _ai_service
+
 
 async def analyze_portfolio_task(data: Dict[str, Any]):
     """
@@ -48,8 +60,8 @@ async def analyze_portfolio_task(data: Dict[str, Any]):
 
         logger.info(f"포트폴리오 분석 시작: 분석 ID={analysis_id}, 사용자 ID={user_id}")
 
-        # PersonalizedAIService 인스턴스 생성
-        ai_service = PersonalizedAIService(test_mode=False)
+        # PersonalizedAIService 인스턴스 가져오기
+        ai_service = _get_ai_service()
 
         # 분석 데이터 구성
         analysis_data = {
@@ -59,8 +71,10 @@ async def analyze_portfolio_task(data: Dict[str, Any]):
             "analysisId": analysis_id,
         }
 
-        # 분석 실행
-        result = ai_service.analyze_portfolio_from_data(analysis_data)
+        # 분석 실행 (동기 OpenAI 호출이 이벤트 루프를 막지 않도록 스레드에서 실행)
+        result = await asyncio.to_thread(
+            ai_service.analyze_portfolio_from_data, analysis_data
+        )
 
         logger.info(f"포트폴리오 분석 완료: 분석 ID={analysis_id}")
         return result
@@ -42,7 +42,10 @@ class TaskManager:
                 return
 
             # 태스크 ID 생성 (새로운 형식의 analysisId를 우선 사용)
-            task_id = str(message_data.get("analysisId", uuid.uuid4()))
+            analysis_id = message_data.get("analysisId")
+            task_id = (
+                str(analysis_id) if analysis_id is not None else str(uuid.uuid4())
+            )
 
             # 태스크 실행
             handler = self.task_handlers[task_type]
@@ -60,6 +63,9 @@ class TaskManager:
 
             logger.info(f"태스크 시작됨: {task_id} (타입: {task_type})")
 
+            # 태스크가 끝날 때까지 대기 (완료 후 메시지 확인 처리를 위해)
+            await asyncio.wait([task])
+
         except Exception as e:
             logger.error(f"메시지 처리 중 오류: {str(e)}")
 
@@ -0,0 +1,28 @@
+"""
+JSON 직렬화 유틸리티
+
+orjson이 설치되어 있으면 orjson을 사용하고, 없으면 표준 json 모듈로 대체합니다.
+파싱 실패 시 두 경우 모두 json.JSONDecodeError(또는 그 하위 클래스)가 발생합니다.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(data: Any) -> bytes:
+    """데이터를 UTF-8 인코딩된 JSON 바이트로 직렬화"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """JSON 바이트 또는 문자열을 파싱"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)